@@ -15,7 +15,6 @@ import numpy as np
 import matplotlib.pyplot as plt
 import scipy.stats as stats
 import pandas as pd
-import pingouin as pg
 
 # additional packages
 from statsmodels.stats.diagnostic import lilliefors
@@ -30,10 +29,10 @@ def check_normality(show_flag: bool=False):
     mySD = 3
 
     # To get reproducable values, I provide a seed value
-    np.random.seed(12345)
+    rng = np.random.default_rng(12345)
 
     # Generate and show random data
-    data = stats.norm.rvs(myMean, mySD, size=numData)
+    data = rng.normal(myMean, mySD, numData)
     fewData = data[:100]
     if show_flag:
         plt.hist(data)
@@ -42,37 +41,41 @@ def check_normality(show_flag: bool=False):
     # --- >>> START stats <<< ---
     # Graphical test: if the data lie on a line, they are pretty much
     # normally distributed
-    # _ = stats.probplot(data, plot=plt)
     if show_flag:
-        pg.qqplot(data)
+        _ = stats.probplot(data, plot=plt)
         plt.show()
 
-    # With pandas Series it is simple to print name/value pairs without any further formatting
-    pVals = pd.Series(np.float64)
-    pFewVals = pd.Series(np.float64)
+    # Collect the p-values in dictionaries, and convert them to pandas Series
+    # for printing: that shows name/value pairs without any further formatting
+    pVals = {}
+    pFewVals = {}
     # The scipy normaltest is based on D-Agostino and Pearsons test that
     # combines skew and kurtosis to produce an omnibus test of normality.
-    _, pVals['Omnibus']    = stats.normaltest(data)
-    _, pFewVals['Omnibus'] = stats.normaltest(fewData)
+    pVals['Omnibus']    = stats.normaltest(data).pvalue
+    pFewVals['Omnibus'] = stats.normaltest(fewData).pvalue
 
     # Shapiro-Wilk test
-    _, pVals['Shapiro-Wilk']    = stats.shapiro(data)
-    _, pFewVals['Shapiro-Wilk'] = stats.shapiro(fewData)
+    pVals['Shapiro-Wilk']    = stats.shapiro(data).pvalue
+    pFewVals['Shapiro-Wilk'] = stats.shapiro(fewData).pvalue
 
     # Or you can check for normality with Lilliefors-test
     _, pVals['Lilliefors']    = lilliefors(data)
     _, pFewVals['Lilliefors'] = lilliefors(fewData)
 
     # Alternatively with original Kolmogorov-Smirnov test
-    _, pVals['Kolmogorov-Smirnov']    = \
-            stats.kstest((data-np.mean(data))/np.std(data,ddof=1), 'norm')
-    _, pFewVals['Kolmogorov-Smirnov'] = \
-        stats.kstest((fewData-np.mean(fewData))/np.std(fewData,ddof=1), 'norm')
+    # (with the data standardized by their sample mean and SD; the division
+    # is done in place, to avoid a second temporary array)
+    z = data - data.mean()
+    z /= data.std(ddof=1)
+    zFew = fewData - fewData.mean()
+    zFew /= fewData.std(ddof=1)
+    pVals['Kolmogorov-Smirnov']    = stats.kstest(z, 'norm').pvalue
+    pFewVals['Kolmogorov-Smirnov'] = stats.kstest(zFew, 'norm').pvalue
 
     print(f'p-values for all {len(data)} data points: ----------------')
-    print(pVals)
+    print(pd.Series(pVals))
     print('p-values for the first 100 data points: ----------------')
-    print(pFewVals)
+    print(pd.Series(pFewVals))
 
     if pVals['Omnibus'] > 0.05:
         print('Data are normally distributed')
@@ -12,6 +12,7 @@ This script shows how to
 # Import standard packages
 import numpy as np
 import scipy.stats as stats
+from scipy.special import ndtr
 import pingouin as pg
 from pprint import pprint
 
@@ -32,14 +33,15 @@ def check_mean() -> float:
 
     # Watch out: by default the standard deviation in numpy is calculated with
     # ddof=0, corresponding to 1/N!
-    myMean = np.mean(data)
-    mySD = np.std(data, ddof=1)     # sample standard deviation
+    myMean = data.mean()
+    mySD = data.std(ddof=1)     # sample standard deviation
+    mySEM = mySD/np.sqrt(len(data))     # standard error of the mean
     print(('Mean and SD: {0:4.2f} and {1:4.2f}'.format(myMean, mySD)))
 
     # Confidence intervals
     tf = stats.t(len(data)-1)
     # multiplication with np.array[-1,1] is a neat trick to implement "+/-"
-    ci = np.mean(data) + stats.sem(data)*np.array([-1,1])*tf.ppf(0.975)
+    ci = myMean + mySEM*np.array([-1,1])*tf.ppf(0.975)
     print(('The confidence intervals are {0:4.2f} to {1:4.2f}.'.format(ci[0], ci[1])))
 
     # Check if there is a significant difference relative to "checkValue"
@@ -67,9 +69,9 @@ def explain_power() -> None:
     """ Reproduce most of the parameters from pingouin's 'ttest' """
 
     # generate the data
-    np.random.seed(12345)
+    rng = np.random.default_rng(12345)
     n = 100
-    data = stats.norm(7,3).rvs(n)
+    data = rng.normal(7, 3, n)
 
     # analysis parameters
     c = 6.5
@@ -81,55 +83,74 @@ def explain_power() -> None:
     std = np.std(data, ddof=1)
     dof = n-1
 
-    h1 = stats.t(df=len(data)-1, loc=mean, scale=sem)
+    t_dist = stats.t(dof)
 
     # reproduce the results of the pingouin T-test
     results = {}
 
     results['dof'] = dof
     results['t_val'] = (mean-c)/sem
-    results['d'] = (mean-c)/np.std(data, ddof=1)
+    results['d'] = (mean-c)/std
 
-    tc = stats.t(dof).isf(alpha/2)
-    results['p_val'] = stats.t(dof).sf(results['t_val'])*2
+    tc = t_dist.isf(alpha/2)
+    results['p_val'] = t_dist.sf(results['t_val'])*2
 
-    results['ci'] = h1.ppf([alpha/2, 1-alpha/2])
+    # (the CI is the standard t-distribution, scaled by sem and shifted by mean)
+    results['ci'] = mean + sem*t_dist.ppf([alpha/2, 1-alpha/2])
 
     # power-calculation
-    nct = stats.nct(df=dof, nc=(mean-c)/sem)
-    results['power'] = nct.sf(tc) + nct.cdf(-tc)
+    nct_dist = stats.nct(df=dof, nc=results['t_val'])
+    results['power'] = nct_dist.sf(tc) + nct_dist.cdf(-tc)
 
     pprint(results)
 
 
-def compareWithNormal():
+def compareWithNormal(B: int=1):
     """ This function is supposed to give you an idea how big/small the
     difference between t- and normal distribution are for realistic
     calculations.
+
+    Parameters
+    ----------
+    B : number of simulated samples (each with 100 data points). All samples
+        are generated and tested at once, along the rows of one array.
+
+    Returns
+    -------
+    normProb : p-value(s) from the normal distribution; a float for B=1, and
+               an array with B values otherwise
     """
 
-    # generate the data
-    np.random.seed(12345)
-    normDist = stats.norm(loc=7, scale=3)
-    data = normDist.rvs(100)
+    # generate the data: one sample per row
+    rng = np.random.default_rng(12345)
+    n = 100
+    data = rng.normal(7, 3, (B, n))
     checkVal = 6.5
 
     # T-test
     # --- >>> START stats <<< ---
-    t, tProb = stats.ttest_1samp(data, checkVal)
+    t, tProb = stats.ttest_1samp(data, checkVal, axis=1)
     # --- >>> STOP stats <<< ---
 
     # Comparison with corresponding normal distribution
-    mmean = np.mean(data)
-    mstd = np.std(data, ddof=1)
-    normProb = stats.norm.cdf(checkVal, loc=mmean,
-            scale=mstd/np.sqrt(len(data)))*2
-
-    # compare
-    print(f'The probability from the t-test is ' + '{tProb:5.4f}, ' +
-          f'and from the normal distribution {normProb:5.4f}')
+    # ("ndtr" is the CDF of the standard normal distribution, i.e. the same as
+    # "stats.norm.cdf", but without the argument checking)
+    mmean = data.mean(axis=1)
+    mstd = data.std(axis=1, ddof=1)
+    normProb = ndtr(-np.abs(checkVal-mmean) / (mstd/np.sqrt(n)))*2
+
+    if B == 1:
+        tProb, normProb = tProb[0], normProb[0]
+
+        # compare
+        print(f'The probability from the t-test is {tProb:5.4f}, ' +
+              f'and from the normal distribution {normProb:5.4f}')
+    else:
+        print(f'In {B} samples, the mean probability from the t-test is ' +
+              f'{tProb.mean():5.4f}, and from the normal distribution ' +
+              f'{normProb.mean():5.4f}')
 
-    return normProb # should be 0.054201154690070759
+    return normProb # for B=1, should be 0.14292694003838727
 
 
 if __name__ == '__main__':
@@ -8,11 +8,14 @@ import matplotlib as mpl
 import matplotlib.pyplot as plt
 import pandas as pd
 import os
+import time
+import hashlib
+from scipy import signal
 
 # modules from 'statsmodels'
-from statsmodels.tsa.seasonal import seasonal_decompose
+from statsmodels.tsa.seasonal import STL
 from statsmodels.tsa.stattools import acf, pacf
-from statsmodels.graphics.tsaplots import plot_acf, plot_pacf
+from statsmodels.graphics.tsaplots import plot_acf
 from statsmodels.tsa.arima.model import ARIMA
 from statsmodels import tsa
 
@@ -36,6 +39,18 @@ except ImportError:
         return
 # -----------------------------------------------
 
+CO2_URL = 'https://www.esrl.noaa.gov/gmd/webdata/ccgg/trends/co2/co2_mm_mlo.txt'
+
+# Local copy of the parsed CO2-data, to avoid repeated downloads. The file name
+# contains a hash of the URL, so that a different URL is downloaded again.
+url_hash = hashlib.blake2b(CO2_URL.encode(), digest_size=4).hexdigest()
+CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache',
+                          f'co2_mm_mlo_{url_hash}.parquet')
+CACHE_MAX_DAYS = 7      # the data are updated monthly by NOAA
+
+# Fitted ARIMA-models, so that re-runs (e.g. in a notebook) are fast
+_arima_fits = {}
+
 
 def get_CO2_data() -> pd.DataFrame:
     """Read in data, and return them as a pandas DataFrame
@@ -46,12 +61,42 @@ def get_CO2_data() -> pd.DataFrame:
     """
 
     # Get the data, display a few values, and show the data
-    url = 'https://www.esrl.noaa.gov/gmd/webdata/ccgg/trends/co2/co2_mm_mlo.txt'
-    df = pd.read_csv(url,
-                     skiprows=53,
-                     delim_whitespace=True,
-                     names = ['year', 'month', 'time', 'co2', 'deseasoned',
-                               'nr_days', 'std_days', 'uncertainty'])
+    # Re-use the local copy of the data if it is recent enough
+    df = None
+    if os.path.exists(CACHE_FILE) and \
+            (time.time() - os.path.getmtime(CACHE_FILE)) < CACHE_MAX_DAYS*24*3600:
+        try:
+            df = pd.read_parquet(CACHE_FILE)
+        except (ImportError, OSError, ValueError):
+            # unreadable local copy: download the data again
+            df = None
+
+    if df is None:
+        # For URLs, pandas sends the "storage_options" as HTTP-headers, and
+        # decompresses gzip-encoded responses
+        df = pd.read_csv(CO2_URL,
+                         storage_options={'Accept-Encoding': 'gzip'},
+                         skiprows=53,
+                         sep=r'\s+',
+                         engine='c',
+                         names = ['year', 'month', 'time', 'co2', 'deseasoned',
+                                   'nr_days', 'std_days', 'uncertainty'],
+                         dtype = {'year':'int16', 'month':'int8', 'time':'float64',
+                                  'co2':'float64', 'deseasoned':'float64',
+                                  'nr_days':'int16', 'std_days':'float64',
+                                  'uncertainty':'float64'})
+
+        # Writing parquet-files requires "pyarrow" (or "fastparquet"). The
+        # data are written to a temporary file first, so that an interrupted
+        # write cannot leave a truncated cache-file behind.
+        tmp_file = f'{CACHE_FILE}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+            df.to_parquet(tmp_file)
+            os.replace(tmp_file, CACHE_FILE)
+        except (ImportError, OSError):
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
 
     # Display the top values, and show CO2-levels as a function of time
     print(df.head())
@@ -69,9 +114,10 @@ def acf_and_pacf(df: pd.DataFrame) -> None:
     ----------
     df : time stamped recordings of CO2-levels at Mauna Loa, Hawaii
     """
-    # Seasonal decomposition
-    result_add = seasonal_decompose(df['co2'], model='additive', period=12,
-            extrapolate_trend='freq')
+    # Seasonal decomposition, with "Seasonal and Trend decomposition using
+    # Loess" (STL). This is additive, and also provides the trend at the ends
+    co2 = df['co2'].to_numpy(dtype=np.float64)
+    result_add = STL(co2, period=12, robust=False).fit()
     result_add.plot()
 
     out_file = 'TSA_decomposition.jpg'
@@ -80,26 +126,79 @@ def acf_and_pacf(df: pd.DataFrame) -> None:
     plt.plot(result_add.resid, '-')
     # plt.xlim(0, 100)
 
-    # Autocorrelation function ...
-    plot_acf(result_add.resid)
-    out_file = 'TSA_acf.jpg'
-    showData(out_file)
-
-    # ... and partial acf
-    plot_pacf(result_add.resid)
-    out_file = 'TSA_pacf.jpg'
+    # Autocorrelation function and partial acf, each calculated only once,
+    # together with their 95%-confidence intervals
+    nlags = 40
+    acf_vals, acf_ci = acf(result_add.resid, nlags=nlags, fft=True, alpha=0.05)
+    pacf_vals, pacf_ci = pacf(result_add.resid, nlags=nlags, method='ywm',
+            alpha=0.05)
+
+    fig, axs = plt.subplots(1, 2)
+    lags = np.arange(nlags+1)
+    for ax, vals, ci, title in zip(axs, [acf_vals, pacf_vals],
+            [acf_ci, pacf_ci], ['Autocorrelation', 'Partial Autocorrelation']):
+        ax.stem(lags, vals)
+        # confidence band around zero, as in 'plot_acf' from statsmodels
+        ax.fill_between(lags[1:], ci[1:,0]-vals[1:], ci[1:,1]-vals[1:],
+                alpha=0.25)
+        ax.set_title(title)
+
+    out_file = 'TSA_acf_pacf.jpg'
     showData(out_file)
 
     return result_add
 
 
-def fit_ARIMA_models(seasonal_decomposition: pd.DataFrame) -> None:
+def fit_ARIMA(data: np.ndarray, order: tuple):
+    """ Fit an ARIMA model to the data, re-using earlier fits of the same
+    data with the same order.
+
+    Parameters
+    ----------
+    data : time series to be fitted
+    order : (p, d, q) order of the ARIMA model
+
+    Returns
+    -------
+    model_fit : fitted model (statsmodels ARIMAResults)
+    """
+
+    data = np.asarray(data, dtype=np.float64)
+    data_hash = hashlib.blake2b(data.tobytes(), digest_size=8).hexdigest()
+    key = (data_hash, tuple(order))
+
+    if key not in _arima_fits:
+        _arima_fits[key] = ARIMA(data, order=order).fit()
+
+    return _arima_fits[key]
+
+
+def show_fit(model_fit, verbose: bool=False) -> None:
+    """ Print the results of an ARIMA fit
+
+    Parameters
+    ----------
+    model_fit : fitted model (statsmodels ARIMAResults)
+    verbose : if True, the full summary table is printed; otherwise only the
+              parameters and the AIC
+    """
+
+    if verbose:
+        print(model_fit.summary())
+    else:
+        print(pd.Series(model_fit.params, index=model_fit.param_names))
+        print(f'AIC: {model_fit.aic:.2f}')
+
+
+def fit_ARIMA_models(seasonal_decomposition: pd.DataFrame,
+                     verbose: bool=False) -> None:
     """ Take the output from the statsmodels seasonal decomposition, and fit
     different ARIMA models to these data.
 
     Parameters
     ----------
     seasonal_decomposition : Trend, Seasonal, and Residuals from the CO2-data
+    verbose : if True, the full summary of each fit is printed
     """
 
     # ARIMA models of the data, to interpret the remaining residuals
@@ -108,27 +207,29 @@ def fit_ARIMA_models(seasonal_decomposition: pd.DataFrame) -> None:
               (0, 0, 2)]
 
     for order in orders:
-        model = ARIMA(seasonal_decomposition.resid, order=(1,0,1))
-        model_fit = model.fit()
-        print(model_fit.summary())
+        model_fit = fit_ARIMA(seasonal_decomposition.resid, order=order)
+        show_fit(model_fit, verbose)
 
     # Generate a clear ARIMA model, ...
     # ... plot it, ...
     print('Generate a clear ARIMA model, plot it')
-    x = [0, 0]
-    for ii in range(200):
-        x.append(x[-1] - 0.5*x[-2] + float(np.random.randn(1)))
+    # The AR(2)-process x[n] = x[n-1] - 0.5*x[n-2] + noise[n] is a linear
+    # filter, starting with two zeros
+    rng = np.random.default_rng(0)
+    noise = rng.standard_normal(202)
+    noise[:2] = 0
+    x = signal.lfilter([1.0], [1.0, -1.0, 0.5], noise)
 
     plt.plot(x)
     plt.show()
 
-    plot_acf(np.array(x))
+    plot_acf(x)
     plt.show()
 
     # ... and fit it
-    model = ARIMA(np.array(x), order=(2,0,0))
+    model = ARIMA(x, order=(2,0,0))
     model_fit = model.fit()
-    print(model_fit.summary())
+    show_fit(model_fit, verbose)
 
     print('And now with "statsmodels":')
     # Generate and fit two ARIMA-models with 'statsmodels'
@@ -142,7 +243,7 @@ def fit_ARIMA_models(seasonal_decomposition: pd.DataFrame) -> None:
 
     model = tsa.arima.model.ARIMA(y, order=(2, 0, 2), trend='n')
     fit = model.fit()
-    print(fit.summary())
+    show_fit(fit, verbose)
 
 
 if __name__ == '__main__':
@@ -16,6 +16,8 @@ import numpy as np
 import pandas as pd
 import sys
 import os
+import io
+import contextlib
 
 rootDir = '..'
 for dirName, subdirList, fileList in os.walk(rootDir, topdown=False):
@@ -203,7 +205,7 @@ class TestSequenceFunctions(unittest.TestCase):
 
     def test_checkNormality(self):
         p = ISP_checkNormality.check_normality(show_flag=False)
-        self.assertAlmostEqual(p, 0.47144747394230224)
+        self.assertAlmostEqual(p, 0.9606731805435642)
 
 
     def test_compGroups(self):
@@ -300,7 +302,11 @@ class TestSequenceFunctions(unittest.TestCase):
         self.assertAlmostEqual(p, 0.018137235176105802)
 
         p2 = ISP_oneGroup.compareWithNormal()
-        self.assertAlmostEqual(p2, 0.054201154690070759)
+        self.assertAlmostEqual(p2, 0.14292694003838727)
+
+        p3 = ISP_oneGroup.compareWithNormal(B=10)
+        self.assertEqual(len(p3), 10)
+        self.assertAlmostEqual(p3[0], 0.14292694003838727)
 
 
     def test_read_zip(self):
@@ -319,6 +325,27 @@ class TestSequenceFunctions(unittest.TestCase):
         self.assertEqual(n2, 35)
 
 
+    def test_timeSeries(self):
+        rng = np.random.default_rng(12345)
+        x = np.cumsum(rng.standard_normal(100)) * 0.1
+        model_fit = ISP_TimeSeries.fit_ARIMA(x, order=(1, 0, 0))
+
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            ISP_TimeSeries.show_fit(model_fit, verbose=False)
+        self.assertIn('AIC:', out.getvalue())
+        self.assertNotIn('Dep. Variable', out.getvalue())
+
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            ISP_TimeSeries.show_fit(model_fit, verbose=True)
+        self.assertIn('SARIMAX Results', out.getvalue())
+        self.assertIn('Dep. Variable', out.getvalue())
+
+        # the second fit of the same data is taken from the cache
+        self.assertIs(ISP_TimeSeries.fit_ARIMA(x, order=(1, 0, 0)), model_fit)
+
+
     def test_twoSample(self):
         p1 = ISP_twoGroups.paired_data()
         self.assertAlmostEqual(p1, 0.0009765625)